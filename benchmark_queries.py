@@ -0,0 +1,116 @@
+"""Compare the ORM and precompiled Core paths for a reaction scoring event.
+
+Runs against a throwaway in-memory SQLite database.
+
+    python benchmark_queries.py
+"""
+import time
+import tracemalloc
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from database import Base, SocialScore, SocialMessageScore, SocialSubmission
+import queries
+
+USERS = 2000
+EVENTS = 2000
+MONTH_KEY = '2026-10'
+
+def seed(Session):
+    """Create a month of scores and one submission per user"""
+    session = Session()
+    for i in range(USERS):
+        session.add(SocialScore(discord_id=str(i), discord_username=f"user{i}", month_key=MONTH_KEY, points=i % 97))
+        session.add(SocialSubmission(discord_id=str(i), date_key='2026-10-01', message_id=i))
+    session.commit()
+    session.close()
+
+def orm_event(Session, event: int):
+    """The per-reaction query sequence as written with session.query()"""
+    session = Session()
+    try:
+        message_id = event % USERS
+        submission = session.query(SocialSubmission).filter_by(message_id=message_id).first()
+        author_id = submission.discord_id
+        judge_id = f"orm-{event}"
+        existing = session.query(SocialMessageScore).filter_by(
+            message_id=message_id, judge_id=judge_id, emoji='🔥'
+        ).first()
+        user_score = session.query(SocialScore).filter_by(discord_id=author_id, month_key=MONTH_KEY).first()
+        if not existing:
+            session.add(SocialMessageScore(
+                message_id=message_id, author_id=author_id, judge_id=judge_id,
+                emoji='🔥', points=4, month_key=MONTH_KEY
+            ))
+            user_score.points += 4
+        rank = session.query(SocialScore).filter(
+            SocialScore.month_key == MONTH_KEY, SocialScore.points > user_score.points
+        ).count() + 1
+        session.query(SocialScore).filter_by(month_key=MONTH_KEY).order_by(SocialScore.points.desc()).limit(10).all()
+        session.commit()
+        return rank
+    finally:
+        session.close()
+
+def core_event(Session, event: int):
+    """The same sequence using the statements in queries.py"""
+    session = Session()
+    try:
+        conn = session.connection()
+        message_id = event % USERS
+        author_id = conn.execute(queries.SUBMISSION_AUTHOR, {'message_id': message_id}).scalar()
+        judge_id = f"core-{event}"
+        existing = conn.execute(queries.MESSAGE_SCORE_EXISTS, {
+            'message_id': message_id, 'judge_id': judge_id, 'emoji': '🔥'
+        }).first()
+        if not existing:
+            conn.execute(queries.INSERT_MESSAGE_SCORE, {
+                'message_id': message_id, 'author_id': author_id, 'judge_id': judge_id,
+                'emoji': '🔥', 'points': 4, 'month_key': MONTH_KEY
+            })
+            points = conn.execute(queries.UPSERT_USER_POINTS, {
+                'discord_id': author_id, 'discord_username': f"user{author_id}", 'month_key': MONTH_KEY, 'points': 4
+            }).scalar()
+        else:
+            points = conn.execute(queries.USER_POINTS, {'discord_id': author_id, 'month_key': MONTH_KEY}).scalar()
+        rank = conn.execute(queries.RANKINGS_AHEAD_COUNT, {
+            'month_key': MONTH_KEY, 'cursor_points': points, 'cursor_id': author_id
+        }).scalar() + 1
+        conn.execute(queries.TOP_SCORES, {'month_key': MONTH_KEY, 'limit': 10}).all()
+        session.commit()
+        return rank
+    finally:
+        session.close()
+
+def measure(name: str, Session, event_fn):
+    """Report per-event latency and allocations for one path"""
+    for event in range(50):
+        event_fn(Session, -event - 1)  # Warm the pool and statement cache
+
+    start = time.perf_counter()
+    for event in range(EVENTS):
+        event_fn(Session, event)
+    elapsed = time.perf_counter() - start
+
+    peak_total = 0
+    tracemalloc.start()
+    for event in range(EVENTS, EVENTS + 200):
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        event_fn(Session, event)
+        peak_total += tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+
+    print(f"{name:>5}: {elapsed / EVENTS * 1e6:8.1f} us/event, {peak_total / 200 / 1024:6.1f} KiB peak allocated/event")
+
+def main():
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    seed(Session)
+
+    print(f"{EVENTS} reaction events against {USERS} users")
+    measure('orm', Session, orm_event)
+    measure('core', Session, core_event)
+
+if __name__ == '__main__':
+    main()
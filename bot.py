@@ -1,11 +1,15 @@
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
-from datetime import datetime
+from datetime import datetime, timedelta
 from sqlalchemy import func
 import config
 from database import get_session, SocialScore, SocialMessageScore, SocialSubmission
+import queries
 import re
+import asyncio
+import hashlib
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 
 intents = discord.Intents.default()
 intents.message_content = True
@@ -16,6 +20,27 @@ intents.reactions = True
 
 bot = commands.Bot(command_prefix='!', intents=intents)
 
+TRACKING_PARAMS = {'fbclid', 'gclid', 'msclkid'}
+TRACKING_PARAM_PREFIXES = ('utm_', 'mc_')
+# Keys that only mean "tracking" on these hosts; elsewhere they can select a different page
+HOST_TRACKING_PARAMS = {
+    'youtube.com': {'t', 'si', 'feature', 'pp'},
+    'x.com': {'s', 't', 'ref_src', 'ref_url'},
+    'instagram.com': {'igshid', 'igsh'},
+    'linkedin.com': {'trk', 'trackingid', 'lipi'},
+}
+HOST_PREFIXES = ('www.', 'm.', 'mobile.')
+HOST_ALIASES = {
+    'twitter.com': 'x.com',
+    'fxtwitter.com': 'x.com',
+    'vxtwitter.com': 'x.com',
+    'youtube-nocookie.com': 'youtube.com',
+    'instagr.am': 'instagram.com',
+}
+
+known_url_hashes = None  # url_hash -> latest created_at within the duplicate window, loaded on first use
+pending_url_hashes = {}  # url_hash -> number of submissions of it still being posted and not yet saved
+
 def get_current_month_key():
     """Get current month in YYYY-MM format"""
     return datetime.utcnow().strftime('%Y-%m')
@@ -50,17 +75,179 @@ def check_daily_submission_limit(discord_id: str) -> tuple[bool, int]:
         session.close()
 
 def validate_submission_content(content: str, attachments: list) -> tuple[bool, str]:
-    """Validate submission has URL or attachment. Returns (is_valid, url_or_attachment)"""
-    url_pattern = r'https?://[^\s]+'
-    urls = re.findall(url_pattern, content)
+    """Validate submission is a single http(s) URL or has an attachment. Returns (is_valid, url_or_attachment)"""
+    url_pattern = r'https?://\S+'
+    url_match = re.fullmatch(url_pattern, content.strip(), re.IGNORECASE)
     
-    if urls:
-        return True, urls[0]
+    if url_match:
+        return True, url_match.group(0)
     elif attachments:
         return True, attachments[0].url
     else:
         return False, ""
 
+def normalize_submission_url(url: str) -> str:
+    """Canonicalize a URL so trivially different links to the same post compare equal. Raises ValueError on malformed URLs"""
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or '').lower()
+    for prefix in HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    host = HOST_ALIASES.get(host, host)
+    path = parts.path.rstrip('/')
+    query = parse_qsl(parts.query, keep_blank_values=True)
+
+    # Short and alternate YouTube forms all point at a single watch URL
+    if host == 'youtu.be' and path:
+        host, query = 'youtube.com', [('v', path.lstrip('/'))] + query
+        path = '/watch'
+    elif host == 'youtube.com' and path.startswith(('/shorts/', '/embed/', '/live/')):
+        query = [('v', path.split('/')[2])] + query
+        path = '/watch'
+
+    host_params = HOST_TRACKING_PARAMS.get(host, set())
+    query = [(key, value) for key, value in query
+             if key.lower() not in TRACKING_PARAMS
+             and key.lower() not in host_params
+             and not key.lower().startswith(TRACKING_PARAM_PREFIXES)]
+
+    # http and https links to the same post are the same submission
+    return urlunsplit(('https', host, path, urlencode(sorted(query)), ''))
+
+def hash_submission_url(url: str) -> str:
+    """Hash a submission URL for the duplicate index"""
+    return hashlib.sha256(normalize_submission_url(url).encode('utf-8')).hexdigest()
+
+def get_duplicate_window_start():
+    """Earliest created_at that still counts as a duplicate, or None to check all submissions"""
+    if config.DUPLICATE_WINDOW_DAYS <= 0:
+        return None
+    return datetime.utcnow() - timedelta(days=config.DUPLICATE_WINDOW_DAYS)
+
+def get_known_url_hashes(session) -> dict:
+    """Load the in-memory hash index that lets most new URLs skip the database probe, dropping expired entries"""
+    global known_url_hashes
+    window_start = get_duplicate_window_start()
+    if known_url_hashes is None:
+        query = session.query(
+            SocialSubmission.url_hash,
+            func.max(SocialSubmission.created_at)
+        ).filter(SocialSubmission.url_hash.isnot(None))
+        if window_start:
+            query = query.filter(SocialSubmission.created_at >= window_start)
+        known_url_hashes = dict(query.group_by(SocialSubmission.url_hash).all())
+    elif window_start:
+        expired = [url_hash for url_hash, created_at in known_url_hashes.items() if created_at < window_start]
+        for url_hash in expired:
+            del known_url_hashes[url_hash]
+    return known_url_hashes
+
+def clear_submission_url_hash(message_id: int):
+    """Drop a deleted submission from the duplicate index so its link can be submitted again"""
+    session = get_session()
+    try:
+        released = [url_hash for url_hash, in session.query(SocialSubmission.url_hash).filter(
+            SocialSubmission.message_id == message_id,
+            SocialSubmission.url_hash.isnot(None)
+        )]
+        if not released:
+            return
+        
+        session.query(SocialSubmission).filter_by(message_id=message_id).update({'url_hash': None})
+        session.commit()
+        
+        if known_url_hashes is not None:
+            for url_hash in released:
+                # Another submission of the same link may still hold it
+                latest = session.query(func.max(SocialSubmission.created_at)).filter(
+                    SocialSubmission.url_hash == url_hash
+                ).scalar()
+                if latest:
+                    known_url_hashes[url_hash] = latest
+                else:
+                    known_url_hashes.pop(url_hash, None)
+    except Exception as e:
+        session.rollback()
+        print(f"❌ Error clearing submission URL: {e}")
+    finally:
+        session.close()
+
+def find_duplicate_submission(url_hash: str) -> int | None:
+    """Return the message ID of an earlier submission of the same URL within the window, if any"""
+    session = get_session()
+    try:
+        if url_hash not in get_known_url_hashes(session):
+            return None
+
+        query = session.query(SocialSubmission.message_id).filter(SocialSubmission.url_hash == url_hash)
+        window_start = get_duplicate_window_start()
+        if window_start:
+            query = query.filter(SocialSubmission.created_at >= window_start)
+        return query.order_by(SocialSubmission.created_at.desc()).limit(1).scalar()
+    finally:
+        session.close()
+
+def fetch_rankings_rows(session, month_key: str, after: tuple = None, before: tuple = None, limit: int = None) -> list:
+    """Fetch a keyset page of (discord_id, discord_username, points) ordered by points desc, discord_id asc.
+
+    `after`/`before` are (points, discord_id) cursors; rows are always returned in leaderboard order."""
+    params = {'month_key': month_key, 'limit': limit or config.RANKINGS_PAGE_SIZE}
+    conn = session.connection()
+
+    if before:
+        params['cursor_points'], params['cursor_id'] = before
+        return list(reversed(conn.execute(queries.RANKINGS_BEFORE, params).all()))
+
+    if after:
+        params['cursor_points'], params['cursor_id'] = after
+        return conn.execute(queries.RANKINGS_AFTER, params).all()
+    return conn.execute(queries.TOP_SCORES, params).all()
+
+def count_rankings_ahead(session, month_key: str, points: int, discord_id: str) -> int:
+    """Count rows ahead of a (points, discord_id) cursor in leaderboard order"""
+    return session.connection().execute(queries.RANKINGS_AHEAD_COUNT, {
+        'month_key': month_key,
+        'cursor_points': points,
+        'cursor_id': discord_id
+    }).scalar()
+
+def count_rankings_total(session, month_key: str) -> int:
+    """Count every ranked row for the month"""
+    return session.connection().execute(queries.RANKINGS_TOTAL, {'month_key': month_key}).scalar()
+
+async def resolve_username(guild: discord.Guild, discord_id: str) -> str:
+    """Resolve a member's username, only going to the API when they are not cached"""
+    member = guild.get_member(int(discord_id))
+    if not member:
+        try:
+            member = await guild.fetch_member(int(discord_id))
+        except (discord.NotFound, discord.HTTPException):
+            return f"User {discord_id}"
+    return str(member)
+
+async def resolve_display_names(guild: discord.Guild, rows: list) -> dict[str, str]:
+    """Resolve display names for a page of rows, fetching uncached members in a single gateway request"""
+    names = {}
+    missing = []
+    for row in rows:
+        member = guild.get_member(int(row.discord_id))
+        if member:
+            names[row.discord_id] = member.display_name
+        else:
+            missing.append(int(row.discord_id))
+
+    if missing:
+        try:
+            for member in await guild.query_members(user_ids=missing, cache=True):
+                names[str(member.id)] = member.display_name
+        except (asyncio.TimeoutError, discord.ClientException) as e:
+            print(f"⚠️ Failed to resolve member names: {e}")
+
+    for row in rows:
+        names.setdefault(row.discord_id, row.discord_username or f"User {row.discord_id}")
+    return names
+
 @bot.event
 async def on_ready():
     print(f'{bot.user} has connected to Discord!')
@@ -102,62 +289,48 @@ async def on_reaction_add(reaction: discord.Reaction, user: discord.User):
     
     session = get_session()
     try:
-        submission = session.query(SocialSubmission).filter_by(
-            message_id=reaction.message.id
-        ).first()
+        conn = session.connection()
+        author_id = conn.execute(queries.SUBMISSION_AUTHOR, {'message_id': reaction.message.id}).scalar()
         
-        if submission:
-            author_id = submission.discord_id
-        elif not reaction.message.author.bot:
+        if not author_id:
+            if reaction.message.author.bot:
+                return
             author_id = str(reaction.message.author.id)
-        else:
-            return
         
         points = config.EMOJI_POINTS[emoji_str]
         month_key = get_current_month_key()
         judge_id = str(user.id)
         message_id = reaction.message.id
         
-        existing_score = session.query(SocialMessageScore).filter_by(
-            message_id=message_id,
-            judge_id=judge_id,
-            emoji=emoji_str
-        ).first()
+        existing_score = conn.execute(queries.MESSAGE_SCORE_EXISTS, {
+            'message_id': message_id,
+            'judge_id': judge_id,
+            'emoji': emoji_str
+        }).first()
         
         if existing_score:
             return
         
-        message_score = SocialMessageScore(
-            message_id=message_id,
-            author_id=author_id,
-            judge_id=judge_id,
-            emoji=emoji_str,
-            points=points,
-            month_key=month_key
-        )
-        session.add(message_score)
-        
-        user_score = session.query(SocialScore).filter_by(
-            discord_id=author_id,
-            month_key=month_key
-        ).first()
-        
-        if not user_score:
-            try:
-                submission_author = await reaction.message.guild.fetch_member(int(author_id))
-                username = str(submission_author)
-            except (discord.NotFound, discord.HTTPException):
-                username = f"User {author_id}"
-            
-            user_score = SocialScore(
-                discord_id=author_id,
-                discord_username=username,
-                month_key=month_key,
-                points=points
-            )
-            session.add(user_score)
-        else:
-            user_score.points += points
+        # Finish the read transaction so the member lookup below never holds one open
+        session.commit()
+        username = await resolve_username(reaction.message.guild, author_id)
+        
+        conn = session.connection()
+        conn.execute(queries.INSERT_MESSAGE_SCORE, {
+            'message_id': message_id,
+            'author_id': author_id,
+            'judge_id': judge_id,
+            'emoji': emoji_str,
+            'points': points,
+            'month_key': month_key
+        })
+        
+        conn.execute(queries.UPSERT_USER_POINTS, {
+            'discord_id': author_id,
+            'discord_username': username,
+            'month_key': month_key,
+            'points': points
+        })
         
         session.commit()
         print(f"✅ Added {points} points to user {author_id} for {emoji_str} from {user.name}")
@@ -187,36 +360,30 @@ async def on_reaction_remove(reaction: discord.Reaction, user: discord.User):
     
     session = get_session()
     try:
-        submission = session.query(SocialSubmission).filter_by(
-            message_id=message_id
-        ).first()
+        conn = session.connection()
+        author_id = conn.execute(queries.SUBMISSION_AUTHOR, {'message_id': message_id}).scalar()
         
-        if submission:
-            author_id = submission.discord_id
-        elif not reaction.message.author.bot:
+        if not author_id:
+            if reaction.message.author.bot:
+                return
             author_id = str(reaction.message.author.id)
-        else:
-            return
-        
-        message_score = session.query(SocialMessageScore).filter_by(
-            message_id=message_id,
-            judge_id=judge_id,
-            emoji=emoji_str
-        ).first()
         
-        if message_score:
-            points = message_score.points
-            score_month_key = message_score.month_key
+        removed_scores = conn.execute(queries.DELETE_MESSAGE_SCORE, {
+            'message_id': message_id,
+            'judge_id': judge_id,
+            'emoji': emoji_str
+        }).all()
+        
+        if removed_scores:
+            points = 0
+            for score_points, score_month_key in removed_scores:
+                conn.execute(queries.ADD_USER_POINTS, {
+                    'user_id': author_id,
+                    'score_month': score_month_key,
+                    'delta': -score_points
+                })
+                points += score_points
             
-            user_score = session.query(SocialScore).filter_by(
-                discord_id=author_id,
-                month_key=score_month_key
-            ).first()
-            
-            if user_score:
-                user_score.points -= points
-            
-            session.delete(message_score)
             session.commit()
             print(f"✅ Removed {points} points from user {author_id} for {emoji_str} by {user.name}")
         
@@ -271,6 +438,14 @@ async def on_message_delete(message: discord.Message):
     finally:
         session.close()
 
+@bot.event
+async def on_raw_message_delete(payload: discord.RawMessageDeleteEvent):
+    """Release the link of a deleted submission, including messages no longer in the cache"""
+    if payload.channel_id != config.SOCIAL_ARMY_CHANNEL_ID:
+        return
+    
+    clear_submission_url_hash(payload.message_id)
+
 @bot.tree.command(name="submit", description="Submit your content to Social Army for judging")
 @app_commands.describe(
     url="URL to your social media post (optional if attaching an image)",
@@ -295,15 +470,56 @@ async def submit(interaction: discord.Interaction, url: str = None, image: disco
         )
         return
     
-    if not url and not image:
+    is_valid, submission_url = validate_submission_content(url or "", [] if url else [image] if image else [])
+    if not is_valid:
         await interaction.response.send_message(
-            "❌ Please provide either a URL or attach an image with your submission.",
+            "❌ URL must be a single link starting with http:// or https://" if url
+            else "❌ Please provide either a URL or attach an image with your submission.",
             ephemeral=True
         )
         return
     
-    submission_url = url if url else image.url
+    url_hash = None
+    duplicate_of = None
+    duplicate_note = None
+    if url:
+        try:
+            url_hash = hash_submission_url(submission_url)
+        except ValueError:
+            await interaction.response.send_message(
+                "❌ That URL isn't valid. Please check it and try again.",
+                ephemeral=True
+            )
+            return
+        
+        duplicate_of = find_duplicate_submission(url_hash)
+        if duplicate_of:
+            duplicate_note = f"https://discord.com/channels/{interaction.guild_id}/{config.SOCIAL_ARMY_CHANNEL_ID}/{duplicate_of}"
+        elif url_hash in pending_url_hashes:
+            # A second /submit of the same link while the first is still posting has no row to find yet
+            duplicate_note = "Another submission of this link is still being posted"
     
+    if duplicate_note and config.DUPLICATE_ACTION == 'reject':
+        await interaction.response.send_message(
+            f"❌ This link has already been submitted: {duplicate_note}" if duplicate_of
+            else "❌ This link is already being submitted.",
+            ephemeral=True
+        )
+        return
+    
+    if url_hash:
+        pending_url_hashes[url_hash] = pending_url_hashes.get(url_hash, 0) + 1
+    try:
+        await post_submission(interaction, discord_id, submission_url, url_hash, image, duplicate_note, current_count)
+    finally:
+        if url_hash:
+            pending_url_hashes[url_hash] -= 1
+            if not pending_url_hashes[url_hash]:
+                del pending_url_hashes[url_hash]
+
+async def post_submission(interaction: discord.Interaction, discord_id: str, submission_url: str, url_hash: str,
+                          image: discord.Attachment, duplicate_note: str, current_count: int):
+    """Post the submission embed, add the scoring reactions and record the submission"""
     await interaction.response.defer()
     
     embed = discord.Embed(
@@ -313,6 +529,8 @@ async def submit(interaction: discord.Interaction, url: str = None, image: disco
         timestamp=datetime.utcnow()
     )
     embed.add_field(name="Content", value=submission_url, inline=False)
+    if duplicate_note:
+        embed.add_field(name="⚠️ Possible Duplicate", value=duplicate_note, inline=False)
     embed.set_footer(text=f"Submission {current_count + 1}/{config.DAILY_SUBMISSION_LIMIT} today")
     
     if image and image.content_type and image.content_type.startswith('image/'):
@@ -333,10 +551,13 @@ async def submit(interaction: discord.Interaction, url: str = None, image: disco
             discord_id=discord_id,
             date_key=date_key,
             message_id=submission_message.id,
-            submission_url=submission_url
+            submission_url=submission_url,
+            url_hash=url_hash
         )
         session.add(submission)
         session.commit()
+        if url_hash and known_url_hashes is not None:
+            known_url_hashes[url_hash] = datetime.utcnow()
         print(f"✅ Submission created for {interaction.user} - Message ID: {submission_message.id}")
     except Exception as e:
         session.rollback()
@@ -344,47 +565,174 @@ async def submit(interaction: discord.Interaction, url: str = None, image: disco
     finally:
         session.close()
 
-@bot.tree.command(name="rankings", description="View the monthly Social Army rankings")
-async def rankings(interaction: discord.Interaction):
-    """Display monthly leaderboard"""
-    await interaction.response.defer()
-    
-    month_key = get_current_month_key()
-    session = get_session()
-    
-    try:
-        top_users = session.query(SocialScore).filter_by(
-            month_key=month_key
-        ).order_by(SocialScore.points.desc()).limit(config.LEADERBOARD_SIZE).all()
-        
-        if not top_users:
-            await interaction.followup.send("No scores yet this month! Start posting in the Social Army channel!")
+class RankingsView(discord.ui.View):
+    """Monthly leaderboard paged with keyset cursors so deep pages cost the same as the first"""
+
+    def __init__(self, owner_id: int, month_key: str, month_name: str):
+        super().__init__(timeout=config.RANKINGS_VIEW_TIMEOUT)
+        self.owner_id = owner_id
+        self.month_key = month_key
+        self.month_name = month_name
+        self.page_size = config.RANKINGS_PAGE_SIZE
+        self.rows = []
+        self.start_rank = 1
+        self.total = 0
+        self.has_prev = False
+        self.has_next = False
+        self.message = None
+
+    def load_first_page(self, session):
+        """Load the top of the leaderboard"""
+        rows = fetch_rankings_rows(session, self.month_key, limit=self.page_size + 1)
+        # The total is a full count, so it is only refreshed here and on My Position, not on every page turn
+        self.total = count_rankings_total(session, self.month_key)
+        self.has_next = len(rows) > self.page_size
+        self.has_prev = False
+        self.rows = rows[:self.page_size]
+        self.start_rank = 1
+
+    def load_next_page(self, session):
+        """Load the page after the last row currently shown"""
+        last = self.rows[-1]
+        rows = fetch_rankings_rows(session, self.month_key, after=(last.points, last.discord_id), limit=self.page_size + 1)
+        if not rows:
+            self.has_next = False
             return
-        
-        month_name = datetime.utcnow().strftime('%B %Y')
+        self.has_next = len(rows) > self.page_size
+        self.has_prev = True
+        self.start_rank += len(self.rows)
+        self.rows = rows[:self.page_size]
+
+    def load_prev_page(self, session):
+        """Load the page before the first row currently shown"""
+        first = self.rows[0]
+        rows = fetch_rankings_rows(session, self.month_key, before=(first.points, first.discord_id), limit=self.page_size + 1)
+        if len(rows) <= self.page_size:
+            # Reached the top, so show a full first page rather than a partial one
+            self.load_first_page(session)
+            return
+        self.has_prev = True
+        self.has_next = True
+        self.rows = rows[1:]
+        self.start_rank = max(self.start_rank - len(self.rows), 2)
+
+    def load_position_page(self, session, discord_id: str) -> bool:
+        """Load a page centred on the given user. Returns False if they have no score this month"""
+        me = session.connection().execute(queries.USER_RANKING_ROW, {
+            'discord_id': discord_id,
+            'month_key': self.month_key
+        }).first()
+        if not me:
+            return False
+
+        cursor = (me.points, me.discord_id)
+        after = fetch_rankings_rows(session, self.month_key, after=cursor, limit=self.page_size)
+        # Near the bottom there are too few rows after the user, so fill the page from above instead
+        wanted_before = max((self.page_size - 1) // 2, self.page_size - 1 - len(after))
+        before = fetch_rankings_rows(session, self.month_key, before=cursor, limit=wanted_before + 1)
+        self.has_prev = len(before) > wanted_before
+        if self.has_prev:
+            before = before[1:]
+
+        remaining = self.page_size - len(before) - 1
+        self.has_next = len(after) > remaining
+
+        self.rows = before + [me] + after[:remaining]
+        self.start_rank = count_rankings_ahead(session, self.month_key, *cursor) + 1 - len(before)
+        self.total = count_rankings_total(session, self.month_key)
+        return True
+
+    async def build_embed(self, guild: discord.Guild) -> discord.Embed:
+        """Render the current page"""
         embed = discord.Embed(
-            title=f"🏆 Social Army Rankings - {month_name}",
+            title=f"🏆 Social Army Rankings - {self.month_name}",
             description="Top contributors this month:",
             color=discord.Color.gold()
         )
-        
+
+        names = await resolve_display_names(guild, self.rows)
         medals = ['🥇', '🥈', '🥉']
-        for idx, user in enumerate(top_users, 1):
+        owner_id = str(self.owner_id)
+        for idx, user in enumerate(self.rows, self.start_rank):
             medal = medals[idx-1] if idx <= 3 else f"#{idx}"
-            try:
-                member = await interaction.guild.fetch_member(int(user.discord_id))
-                username = member.display_name
-            except:
-                username = user.discord_username or f"User {user.discord_id}"
-            
+            marker = " ⬅️ you" if user.discord_id == owner_id else ""
             embed.add_field(
-                name=f"{medal} {username}",
+                name=f"{medal} {names[user.discord_id]}{marker}",
                 value=f"**{user.points}** points",
                 inline=False
             )
-        
-        await interaction.followup.send(embed=embed)
-        
+
+        end_rank = self.start_rank + len(self.rows) - 1
+        embed.set_footer(text=f"Showing #{self.start_rank}-#{end_rank} of {self.total}")
+
+        self.previous_page.disabled = not self.has_prev
+        self.next_page.disabled = not self.has_next
+        return embed
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.owner_id:
+            await interaction.response.send_message("❌ Use /rankings to page through the leaderboard yourself.", ephemeral=True)
+            return False
+        return True
+
+    async def on_timeout(self):
+        for item in self.children:
+            item.disabled = True
+        if self.message:
+            try:
+                await self.message.edit(view=self)
+            except discord.HTTPException:
+                pass
+
+    async def show(self, interaction: discord.Interaction, load):
+        """Run a page loader and redraw the message"""
+        await interaction.response.defer()
+        session = get_session()
+        try:
+            if load(session) is False:
+                await interaction.followup.send("You have no points this month yet!", ephemeral=True)
+                return
+        except Exception as e:
+            await interaction.followup.send(f"❌ Error: {str(e)}", ephemeral=True)
+            return
+        finally:
+            session.close()
+
+        embed = await self.build_embed(interaction.guild)
+        await interaction.edit_original_response(embed=embed, view=self)
+
+    @discord.ui.button(label="Previous", emoji="◀️", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show(interaction, self.load_prev_page)
+
+    @discord.ui.button(label="Next", emoji="▶️", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show(interaction, self.load_next_page)
+
+    @discord.ui.button(label="My Position", emoji="📍", style=discord.ButtonStyle.primary)
+    async def my_position(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show(interaction, lambda session: self.load_position_page(session, str(interaction.user.id)))
+
+@bot.tree.command(name="rankings", description="View the monthly Social Army rankings")
+async def rankings(interaction: discord.Interaction):
+    """Display monthly leaderboard"""
+    await interaction.response.defer()
+
+    month_key = get_current_month_key()
+    month_name = datetime.utcnow().strftime('%B %Y')
+    view = RankingsView(interaction.user.id, month_key, month_name)
+    session = get_session()
+
+    try:
+        view.load_first_page(session)
+
+        if not view.rows:
+            await interaction.followup.send("No scores yet this month! Start posting in the Social Army channel!")
+            return
+
+        embed = await view.build_embed(interaction.guild)
+        view.message = await interaction.followup.send(embed=embed, view=view)
+
     except Exception as e:
         await interaction.followup.send(f"❌ Error: {str(e)}")
     finally:
@@ -401,19 +749,17 @@ async def social_stats(interaction: discord.Interaction, user: discord.Member =
     session = get_session()
     
     try:
-        user_score = session.query(SocialScore).filter_by(
-            discord_id=str(target_user.id),
-            month_key=month_key
-        ).first()
+        conn = session.connection()
+        user_points = conn.execute(queries.USER_POINTS, {
+            'discord_id': str(target_user.id),
+            'month_key': month_key
+        }).scalar()
         
-        if not user_score or user_score.points == 0:
+        if not user_points:
             await interaction.followup.send(f"{target_user.display_name} has no points this month yet!")
             return
         
-        rank = session.query(SocialScore).filter(
-            SocialScore.month_key == month_key,
-            SocialScore.points > user_score.points
-        ).count() + 1
+        rank = count_rankings_ahead(session, month_key, user_points, str(target_user.id)) + 1
         
         message_scores = session.query(SocialMessageScore).filter_by(
             author_id=str(target_user.id),
@@ -431,7 +777,7 @@ async def social_stats(interaction: discord.Interaction, user: discord.Member =
             color=discord.Color.blue()
         )
         
-        embed.add_field(name="Total Points", value=f"**{user_score.points}**", inline=True)
+        embed.add_field(name="Total Points", value=f"**{user_points}**", inline=True)
         embed.add_field(name="Rank", value=f"**#{rank}**", inline=True)
         embed.add_field(name="Reactions Received", value=f"**{len(message_scores)}**", inline=True)
         
@@ -492,9 +838,7 @@ async def social_reset(interaction: discord.Interaction):
     session = get_session()
     
     try:
-        top_users = session.query(SocialScore).filter_by(
-            month_key=month_key
-        ).order_by(SocialScore.points.desc()).limit(3).all()
+        top_users = session.connection().execute(queries.TOP_SCORES, {'month_key': month_key, 'limit': 3}).all()
         
         winners_announced = False
         if top_users:
@@ -554,9 +898,7 @@ async def social_export(interaction: discord.Interaction, limit: int = 10):
     session = get_session()
     
     try:
-        top_users = session.query(SocialScore).filter_by(
-            month_key=month_key
-        ).order_by(SocialScore.points.desc()).limit(limit).all()
+        top_users = session.connection().execute(queries.TOP_SCORES, {'month_key': month_key, 'limit': limit}).all()
         
         if not top_users:
             await interaction.followup.send("No scores to export!", ephemeral=True)
@@ -13,7 +13,11 @@ SOCIAL_ARMY_CHANNEL_ID = int(os.getenv('SOCIAL_ARMY_CHANNEL_ID', 0))
 SOCIAL_ARMY_JUDGE_ROLE_NAME = os.getenv('SOCIAL_ARMY_JUDGE_ROLE_NAME', 'Social Army Judge')
 SOCIAL_ARMY_ELITE_ROLE_NAME = os.getenv('SOCIAL_ARMY_ELITE_ROLE_NAME', 'Social Army Elite')
 LEADERBOARD_SIZE = int(os.getenv('LEADERBOARD_SIZE', 10))
+RANKINGS_PAGE_SIZE = min(int(os.getenv('RANKINGS_PAGE_SIZE', LEADERBOARD_SIZE)), 25)  # Embeds hold at most 25 fields
+RANKINGS_VIEW_TIMEOUT = int(os.getenv('RANKINGS_VIEW_TIMEOUT', 300))
 DAILY_SUBMISSION_LIMIT = int(os.getenv('DAILY_SUBMISSION_LIMIT', 5))
+DUPLICATE_WINDOW_DAYS = int(os.getenv('DUPLICATE_WINDOW_DAYS', 30))  # 0 checks all past submissions
+DUPLICATE_ACTION = os.getenv('DUPLICATE_ACTION', 'reject').lower()  # 'reject' or 'flag'
 
 EMOJI_POINTS = {
     '✍️': 1,
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, BigInteger, Index
+from sqlalchemy import create_engine, Column, Integer, String, DateTime, BigInteger, Index, inspect, text, select, update, delete, func
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
@@ -19,7 +19,8 @@ class SocialScore(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     __table_args__ = (
-        Index('idx_user_month', 'discord_id', 'month_key'),
+        Index('uq_user_month', 'discord_id', 'month_key', unique=True),  # Conflict target for the score upsert
+        Index('idx_month_points_user', month_key, points.desc(), discord_id),  # Keyset order for /rankings
     )
 
 class SocialMessageScore(Base):
@@ -48,20 +49,68 @@ class SocialSubmission(Base):
     date_key = Column(String(10), nullable=False, index=True)  # Format: YYYY-MM-DD
     message_id = Column(BigInteger, nullable=False)
     submission_url = Column(String(500))
+    url_hash = Column(String(64))  # SHA-256 of the normalized URL, NULL for image uploads
     created_at = Column(DateTime, default=datetime.utcnow)
     
     __table_args__ = (
         Index('idx_user_date', 'discord_id', 'date_key'),
+        Index('idx_url_hash_created', 'url_hash', 'created_at'),
+        Index('idx_submission_message', 'message_id'),
     )
 
+_engine = None
+_Session = None
+
+def get_engine():
+    """Get the shared engine, so the connection pool and compiled statement cache persist across events"""
+    global _engine
+    if _engine is None:
+        _engine = create_engine(config.DATABASE_URL, pool_pre_ping=True)
+    return _engine
+
+def merge_duplicate_scores(engine):
+    """Fold duplicate (discord_id, month_key) score rows into one so the unique index can be built"""
+    scores = SocialScore.__table__
+    with engine.begin() as conn:
+        duplicates = conn.execute(
+            select(scores.c.discord_id, scores.c.month_key, func.min(scores.c.id), func.sum(scores.c.points))
+            .group_by(scores.c.discord_id, scores.c.month_key)
+            .having(func.count() > 1)
+        ).all()
+        for discord_id, month_key, keep_id, total_points in duplicates:
+            conn.execute(update(scores).where(scores.c.id == keep_id).values(points=total_points))
+            conn.execute(delete(scores).where(
+                scores.c.discord_id == discord_id,
+                scores.c.month_key == month_key,
+                scores.c.id != keep_id
+            ))
+        if duplicates:
+            print(f"Merged duplicate score rows for {len(duplicates)} user-month(s)")
+
 def init_db():
     """Initialize the database schema"""
-    engine = create_engine(config.DATABASE_URL)
+    engine = get_engine()
     Base.metadata.create_all(engine)
+    # create_all never alters existing tables, so add columns introduced since
+    existing = {column['name'] for column in inspect(engine).get_columns(SocialSubmission.__tablename__)}
+    if 'url_hash' not in existing:
+        with engine.begin() as conn:
+            conn.execute(text(f"ALTER TABLE {SocialSubmission.__tablename__} ADD COLUMN url_hash VARCHAR(64)"))
+    score_indexes = {index['name'] for index in inspect(engine).get_indexes(SocialScore.__tablename__)}
+    if 'uq_user_month' not in score_indexes:
+        merge_duplicate_scores(engine)
+        if 'idx_user_month' in score_indexes:
+            with engine.begin() as conn:
+                conn.execute(text("DROP INDEX idx_user_month"))
+    # create_all skips tables that already exist, so add any indexes introduced since
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
     return engine
 
 def get_session():
     """Get a database session"""
-    engine = create_engine(config.DATABASE_URL)
-    Session = sessionmaker(bind=engine)
-    return Session()
+    global _Session
+    if _Session is None:
+        _Session = sessionmaker(bind=get_engine())
+    return _Session()
@@ -0,0 +1,109 @@
+"""Prebuilt Core statements for the hot scoring and lookup paths.
+
+Each statement is constructed once at import and executed with bound parameters,
+so the engine's compiled statement cache hits on every event and rows come back
+as plain tuples instead of hydrated ORM objects."""
+from sqlalchemy import select, insert, update, delete, func, bindparam, Integer, and_, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from database import SocialScore, SocialMessageScore, SocialSubmission
+
+scores = SocialScore.__table__
+message_scores = SocialMessageScore.__table__
+submissions = SocialSubmission.__table__
+
+# Params: message_id
+SUBMISSION_AUTHOR = select(submissions.c.discord_id).where(
+    submissions.c.message_id == bindparam('message_id')
+).limit(1)
+
+# Params: message_id, judge_id, emoji
+MESSAGE_SCORE_EXISTS = select(message_scores.c.id).where(
+    message_scores.c.message_id == bindparam('message_id'),
+    message_scores.c.judge_id == bindparam('judge_id'),
+    message_scores.c.emoji == bindparam('emoji')
+).limit(1)
+
+# Params: message_id, author_id, judge_id, emoji, points, month_key
+INSERT_MESSAGE_SCORE = insert(message_scores)
+
+# Params: message_id, judge_id, emoji. Returns the removed (points, month_key) rows
+DELETE_MESSAGE_SCORE = delete(message_scores).where(
+    message_scores.c.message_id == bindparam('message_id'),
+    message_scores.c.judge_id == bindparam('judge_id'),
+    message_scores.c.emoji == bindparam('emoji')
+).returning(message_scores.c.points, message_scores.c.month_key)
+
+# Params: user_id, score_month, delta. Returns the new total, or nothing if the user has no score row
+ADD_USER_POINTS = update(scores).where(
+    scores.c.discord_id == bindparam('user_id'),
+    scores.c.month_key == bindparam('score_month')
+).values(points=scores.c.points + bindparam('delta')).returning(scores.c.points)
+
+# Params: discord_id, discord_username, month_key, points. Returns the new total
+_upsert_user_score = pg_insert(scores)
+UPSERT_USER_POINTS = _upsert_user_score.on_conflict_do_update(
+    index_elements=[scores.c.discord_id, scores.c.month_key],
+    set_={
+        'points': scores.c.points + _upsert_user_score.excluded.points,
+        'updated_at': _upsert_user_score.excluded.updated_at
+    }
+).returning(scores.c.points)
+
+# Params: discord_id, month_key
+USER_POINTS = select(scores.c.points).where(
+    scores.c.discord_id == bindparam('discord_id'),
+    scores.c.month_key == bindparam('month_key')
+).limit(1)
+
+# Leaderboard order is points desc, then discord_id asc so ties rank the same everywhere
+RANKING_COLUMNS = (scores.c.discord_id, scores.c.discord_username, scores.c.points)
+RANKING_ORDER = (scores.c.points.desc(), scores.c.discord_id.asc())
+
+# Params: month_key, limit
+TOP_SCORES = select(*RANKING_COLUMNS).where(
+    scores.c.month_key == bindparam('month_key')
+).order_by(*RANKING_ORDER).limit(bindparam('limit', type_=Integer))
+
+# The plain points bound lets idx_month_points_user seek straight to the cursor;
+# the OR then only filters rows tied on points.
+
+# Params: month_key, cursor_points, cursor_id, limit. Rows after the cursor in leaderboard order
+RANKINGS_AFTER = select(*RANKING_COLUMNS).where(
+    scores.c.month_key == bindparam('month_key'),
+    scores.c.points <= bindparam('cursor_points'),
+    or_(
+        scores.c.points < bindparam('cursor_points'),
+        and_(scores.c.points == bindparam('cursor_points'), scores.c.discord_id > bindparam('cursor_id'))
+    )
+).order_by(*RANKING_ORDER).limit(bindparam('limit', type_=Integer))
+
+# Params: month_key, cursor_points, cursor_id, limit. Rows before the cursor, nearest first
+RANKINGS_BEFORE = select(*RANKING_COLUMNS).where(
+    scores.c.month_key == bindparam('month_key'),
+    scores.c.points >= bindparam('cursor_points'),
+    or_(
+        scores.c.points > bindparam('cursor_points'),
+        and_(scores.c.points == bindparam('cursor_points'), scores.c.discord_id < bindparam('cursor_id'))
+    )
+).order_by(scores.c.points.asc(), scores.c.discord_id.desc()).limit(bindparam('limit', type_=Integer))
+
+# Params: month_key, cursor_points, cursor_id. Rank is this count + 1, with ties ordered by discord_id
+RANKINGS_AHEAD_COUNT = select(func.count()).select_from(scores).where(
+    scores.c.month_key == bindparam('month_key'),
+    scores.c.points >= bindparam('cursor_points'),
+    or_(
+        scores.c.points > bindparam('cursor_points'),
+        and_(scores.c.points == bindparam('cursor_points'), scores.c.discord_id < bindparam('cursor_id'))
+    )
+)
+
+# Params: month_key
+RANKINGS_TOTAL = select(func.count()).select_from(scores).where(
+    scores.c.month_key == bindparam('month_key')
+)
+
+# Params: discord_id, month_key
+USER_RANKING_ROW = select(*RANKING_COLUMNS).where(
+    scores.c.discord_id == bindparam('discord_id'),
+    scores.c.month_key == bindparam('month_key')
+).limit(1)